@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# coding: utf-8
+"""
+Shared core for the NBA wins pool Streamlit apps.
+
+Holds everything that does not depend on the data source: the pool
+configuration, the team→participant mapping, standings/history math,
+chart builders and the page layout. Entrypoints supply a cached
+``fetch_all_games()`` callable (e.g. backed by ``leaguegamefinder``) and
+call :func:`render_app` with it.
+"""
+
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import streamlit as st
+import matplotlib.pyplot as plt
+import os
+import re
+from nba_api.stats.static import teams as static_teams
+
+# ---------------------------------------------------------------------------
+# CONFIGURATION
+# ---------------------------------------------------------------------------
+
+BANNER_PATH = "banner.png"
+CURRENT_SEASON = "2025-26"
+CACHE_DIR = ".cache"
+
+PARTICIPANT_TEAMS = {
+    "Zack": ["Cavaliers", "Mavericks", "Pistons", "Hornets"],
+    "Ryan": ["Thunder", "Bucks", "Hawks", "Bulls"],
+    "Streif": ["Knicks", "Lakers", "Raptors", "76ers"],
+    "Doug": ["Rockets", "Timberwolves", "Grizzlies", "Heat"],
+    "Chris": ["Nuggets", "Spurs", "Warriors", "Trail Blazers"],
+    "Matt": ["Magic", "Celtics", "Clippers", "Pacers"]
+}
+
+
+# Single compiled alternation over every nickname key — one scan per team name
+# instead of a participants × keys substring loop.
+KEY_TO_OWNER = {key.lower(): owner
+                for owner, keys in PARTICIPANT_TEAMS.items() for key in keys}
+TEAM_KEY_PATTERN = re.compile('(' + '|'.join(map(re.escape, KEY_TO_OWNER)) + ')')
+
+
+def _build_team_to_participant() -> dict:
+    """Map each full NBA team name to its owning participant, resolved once."""
+    mapping = {}
+    for team in static_teams.get_teams():
+        match = TEAM_KEY_PATTERN.search(team['full_name'].lower())
+        if match:
+            mapping[team['full_name']] = KEY_TO_OWNER[match.group(1)]
+    return mapping
+
+
+TEAM_TO_PARTICIPANT = _build_team_to_participant()
+
+# The games fetcher injected by the entrypoint via render_app().
+_fetch_all_games = None
+
+# ---------------------------------------------------------------------------
+# STANDINGS AND HISTORY
+# ---------------------------------------------------------------------------
+
+def _standings_as_of(games: pd.DataFrame, cutoff: datetime) -> pd.DataFrame:
+    """Count wins per team from the season games played up to a cutoff date."""
+    if games.empty:
+        return pd.DataFrame(columns=['team', 'wins'])
+    games = games[games['GAME_DATE'] <= cutoff]
+
+    # Count wins per team with a bincount over the category codes — a single
+    # indexed add, no hash table
+    teams = games['TEAM_NAME']
+    won = games['WL'].eq('W').to_numpy()
+    if not won.any():
+        # No completed games yet — keep the baseline empty-standings shape
+        # so the page shows its "no data yet" warning instead of zero rows.
+        return pd.DataFrame(columns=['team', 'wins'])
+    counts = np.bincount(teams.cat.codes.to_numpy()[won],
+                         minlength=len(teams.cat.categories))
+    wins = (pd.Series(counts, index=teams.cat.categories, name='wins')
+              .rename_axis('team')
+              .reset_index())
+
+    return wins.sort_values(by='wins', ascending=False).reset_index(drop=True)
+
+
+@st.cache_data(ttl=3600)
+def fetch_standings_for_date(date: pd.Timestamp) -> pd.DataFrame:
+    """
+    Compute NBA standings as of a given date from the cached season games.
+    Filters to 2025-26 regular season games up to the provided date.
+    """
+    try:
+        return _standings_as_of(_fetch_all_games(), date)
+    except Exception as e:
+        st.error(f"Error fetching standings for {date.date()}: {e}")
+        return pd.DataFrame(columns=['team', 'wins'])
+
+
+def calculate_totals(df: pd.DataFrame) -> pd.Series:
+    """Sum total wins for each participant based on selected teams."""
+    owners = df['team'].map(TEAM_TO_PARTICIPANT)
+    return (df.groupby(owners)['wins'].sum()
+              .reindex(PARTICIPANT_TEAMS, fill_value=0)
+              .rename('Win Total'))
+
+
+def _cumulative_team_wins(games: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build a (n_days, n_teams) cumulative-wins matrix for the season so far.
+    One indexed add plus a cumsum over NumPy label arrays — no hashing in
+    the per-game loop.
+    """
+    wins = games[games['WL'].eq('W')]
+    if wins.empty:
+        return pd.DataFrame()
+    days = pd.date_range(wins['GAME_DATE'].min().normalize(),
+                         wins['GAME_DATE'].max().normalize())
+    day_idx = (wins['GAME_DATE'].dt.normalize() - days[0]).dt.days.to_numpy()
+    team_codes, team_names = pd.factorize(wins['TEAM_NAME'])
+
+    out = np.zeros((len(days), len(team_names)), dtype=np.int32)
+    np.add.at(out, (day_idx, team_codes), 1)
+    np.cumsum(out, axis=0, out=out)
+    return pd.DataFrame(out, index=days, columns=team_names)
+
+
+def _participant_onehot(team_names) -> np.ndarray:
+    """0/1 matrix with one row per team column and one column per participant."""
+    participants = {name: i for i, name in enumerate(PARTICIPANT_TEAMS)}
+    onehot = np.zeros((len(team_names), len(participants)), dtype=np.int32)
+    for row, team in enumerate(team_names):
+        owner = TEAM_TO_PARTICIPANT.get(team)
+        if owner is not None:
+            onehot[row, participants[owner]] = 1
+    return onehot
+
+
+@st.cache_data(ttl=3600)
+def daily_participant_matrix() -> pd.DataFrame:
+    """
+    Season-wide cumulative participant wins per calendar day. Every date
+    range shares this one cached table, so switching time ranges never
+    recomputes anything.
+    """
+    games = _fetch_all_games()
+    if games.empty:
+        return pd.DataFrame()
+
+    # Team-level cumulative matrix times the one-hot ownership matrix:
+    # per-participant daily totals in a single matmul.
+    cum = _cumulative_team_wins(games)
+    if cum.empty:
+        return pd.DataFrame()
+    totals = cum.to_numpy() @ _participant_onehot(cum.columns)
+    return pd.DataFrame(totals, index=cum.index,
+                        columns=list(PARTICIPANT_TEAMS)).rename_axis('date')
+
+
+def fetch_history(start_date: pd.Timestamp, end_date: pd.Timestamp) -> pd.DataFrame:
+    """Slice participant totals for a date range out of the cached season table."""
+    matrix = daily_participant_matrix()
+    if matrix.empty:
+        return matrix
+
+    # Carry totals forward onto calendar days past the last game played.
+    end = max(end_date, matrix.index.max())
+    full = (matrix.reindex(pd.date_range(matrix.index.min(), end), method='ffill')
+                  .rename_axis('date'))
+    return full.loc[start_date:end_date]
+
+# ---------------------------------------------------------------------------
+# PLOTTING
+# ---------------------------------------------------------------------------
+
+@st.cache_resource(hash_funcs={pd.Series: lambda s: pd.util.hash_pandas_object(s).sum()})
+def build_totals_chart(totals: pd.Series) -> plt.Figure:
+    """Bar chart of current participant win totals, reused across reruns."""
+    fig, ax = plt.subplots()
+    totals.sort_values(ascending=False).plot(kind="bar", ax=ax, rot=45)
+    ax.bar_label(ax.containers[0])
+    ax.set_ylabel("Wins")
+    return fig
+
+
+@st.cache_resource(hash_funcs={pd.DataFrame: lambda df: pd.util.hash_pandas_object(df).sum()})
+def build_history_chart(history: pd.DataFrame) -> plt.Figure:
+    """Line chart of participant win totals over time, reused across reruns."""
+    fig, ax = plt.subplots()
+    history.plot(marker='', ax=ax)
+    ax.set_ylabel("Total Wins")
+    ax.set_xlabel("Date")
+    return fig
+
+
+# ---------------------------------------------------------------------------
+# STREAMLIT APP
+# ---------------------------------------------------------------------------
+
+def _main():
+    if os.path.isfile(BANNER_PATH):
+        st.image(BANNER_PATH, use_container_width=True)
+
+    today = pd.Timestamp.today().normalize()
+
+    with st.spinner("Calculating current NBA standings..."):
+        standings_df = fetch_standings_for_date(today)
+
+    if standings_df.empty:
+        st.warning("No standings data available yet for this season.")
+        return
+
+    totals = calculate_totals(standings_df)
+
+    # Optional standings
+    if st.checkbox("Show NBA Standings Table"):
+        st.dataframe(standings_df)
+
+    # Bar chart of current totals
+    st.subheader("Current Participant Win Totals")
+    st.pyplot(build_totals_chart(totals))
+
+    # Historical chart
+    st.subheader("Participant Win Totals Over Time")
+    time_range = st.radio(
+        "Select time range:",
+        ["Past 30 Days", "Past 14 Days", "Past Week"],
+        horizontal=True,
+        index=1
+    )
+
+    if time_range == "Past Week":
+        start_date = today - pd.Timedelta(days=7)
+    elif time_range == "Past 14 Days":
+        start_date = today - pd.Timedelta(days=14)
+    else:
+        start_date = today - pd.Timedelta(days=30)
+
+    with st.spinner("Loading win history..."):
+        history = fetch_history(start_date, today)
+
+    if not history.empty:
+        st.pyplot(build_history_chart(history))
+    else:
+        st.info("No historical data available for this period.")
+
+
+def render_app(fetch_all_games_fn) -> None:
+    """Render the pool page using the given cached season-games fetcher."""
+    global _fetch_all_games
+    _fetch_all_games = fetch_all_games_fn
+    _main()